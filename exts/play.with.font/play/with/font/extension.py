@@ -46,6 +46,7 @@ from .formable.deformable_generate import DeformableBodyGenerator
 ################################# flaming font ui #######################################
 from  .ui.style import julia_modeler_style
 from .ui.custom_ui_widget import *
+from .ui import custom_ui_widget
 from .ui.custom_color_widget import CustomColorWidget
 
 from omni.kit.window.popup_dialog import MessageDialog
@@ -59,6 +60,9 @@ class MyExtension(omni.ext.IExt):
     def on_startup(self, ext_id):
         print("[play.with.font] MyExtension startup")
 
+        # widget value changes are coalesced onto the app update tick
+        custom_ui_widget.enable_value_change_subscription()
+
         # enable flow in rendering
         omni.kit.commands.execute("ChangeSetting", path="rtx/flow/enabled", value=True)
 
@@ -187,7 +191,7 @@ class MyExtension(omni.ext.IExt):
         Start a new scene
         """
         # clear memory
-        self.on_shutdown() 
+        self.clear_memory()
 
         # new scene
         omni.kit.window.file.new()
@@ -255,6 +259,12 @@ class MyExtension(omni.ext.IExt):
 
 
     def on_shutdown(self):
+        self.clear_memory()
+
+        # stop coalescing widget value changes
+        custom_ui_widget.release_value_change_subscription()
+
+    def clear_memory(self):
         print("[play.with.font] play.with.font clear memory")
 
         if self.fluid_generator:
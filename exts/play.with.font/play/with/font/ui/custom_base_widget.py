@@ -19,6 +19,13 @@ class CustomBaseWidget:
     """The base widget for custom widgets that follow the pattern of Head (Label),
     Body Widgets, Tail Widget"""
 
+    # Fixed instance layout. __weakref__ keeps widgets weak-referenceable,
+    # as they were before slots.
+    __slots__ = ("existing_model", "revert_img", "__attr_label", "__frame", "tooltip", "__weakref__")
+
+    # Subclasses without a revert arrow set this to False to skip _build_tail
+    HAS_TAIL = True
+
     def __init__(self, *args, model=None, **kwargs):
         self.existing_model: Optional[ui.AbstractItemModel] = kwargs.pop("model", None)
         self.revert_img = None
@@ -40,6 +47,12 @@ class CustomBaseWidget:
         """
         return getattr(self.__frame, attr)
 
+    def _set_revert_enabled(self, enabled: bool):
+        """Enable or disable revert_img. Writing the property dirties the
+        image, so it is only written when the state actually changes."""
+        if self.revert_img.enabled != enabled:
+            self.revert_img.enabled = enabled
+
     def _build_head(self):
         """Build the left-most piece of the widget line (label in this case)"""
         ui.Label(
@@ -81,4 +94,5 @@ class CustomBaseWidget:
         with ui.HStack():
             self._build_head()
             self._build_body()
-            self._build_tail()
+            if self.HAS_TAIL:
+                self._build_tail()
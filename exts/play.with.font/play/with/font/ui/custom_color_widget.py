@@ -40,7 +40,7 @@ class CustomColorWidget(CustomBaseWidget):
         CustomBaseWidget.__init__(self, model=model, **kwargs)
 
     def destroy(self):
-        CustomBaseWidget.destroy()
+        CustomBaseWidget.destroy(self)
         self.__strfield = None
         self.__colorpicker = None
         self.__color_sub = None
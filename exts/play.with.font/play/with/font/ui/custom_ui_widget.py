@@ -1,55 +1,165 @@
+__all__ = [
+    "CustomComboboxWidget",
+    "CustomBoolWidget",
+    "CustomSliderWidget",
+    "CustomButtonSelectionGroup",
+    "CustomSkySelectionGroup",
+    "CustomFlowSelectionGroup",
+    "CustomStringField",
+    "CustomPathButtonWidget",
+]
+
+import time
+import traceback
+from functools import partial
 from typing import List, Optional
 
+import carb
 import omni
+import omni.kit.app
 import omni.ui as ui
 
 from .style import ATTR_LABEL_WIDTH, BLOCK_HEIGHT, cl, fl
 from .custom_base_widget import CustomBaseWidget
 
-SPACING = 5  
+NUM_FIELD_WIDTH = 50
+FIELD_HEIGHT = 22  # TODO: Once Field padding is fixed, this should be 18
+TEXTURE_NAME = "slider_bg_texture"
+PRESSED_BUTTON_NAME = "control_button_pressed2"
+
+# Layout lengths, bound once instead of per build
+SLIDER_WIDTH = ui.Percent(100)
+COMBOBOX_MARGIN_WIDTH = ui.Percent(30)
+SLIDER_COLUMN_WIDTH = ui.Fraction(3)
+FIELD_COLUMN_WIDTH = ui.Fraction(1)
+
+# Shared by every slider's number field, rather than rebuilt per slider
+_FIELD_STYLE = {
+    "background_color": cl.transparent,
+    "border_color": cl.transparent,
+    "padding": 4,
+    "font_size": fl.field_text_font_size,
+}
+
+# Image names indexed by the checked state
+_BOOL_NAMES = ("unchecked", "checked")
+
+# (key passed to _on_button, button label)
+_SKY_BUTTONS = (
+    ("clear", "Sunny"),
+    ("cloudy", "Cloudy"),
+    ("overcast", "Overcast"),
+    ("night", "Night"),
+)
+_FLOW_BUTTONS = (
+    ("fire", "Fire"),
+    ("smoke", "Smoke"),
+    ("dust", "Dust"),
+)
+
+
+# Widgets whose value changed since the last app update. Model callbacks only
+# queue the widget, and the work runs once per frame in _flush_pending.
+_pending = set()
+_update_sub = None
+# Set once the extension shuts down, so late model changes can't subscribe again
+_released = False
+
+
+def _queue_value_changed(widget):
+    global _update_sub
+    if _released:
+        return
+    if _update_sub is None:
+        _update_sub = omni.kit.app.get_app().get_update_event_stream().create_subscription_to_pop(
+            _flush_pending, name="play.with.font widget value changes")
+    _pending.add(widget)
+
+
+def _flush_pending(event):
+    widgets = list(_pending)
+    _pending.clear()
+    for widget in widgets:
+        # One failing widget (or user callback) must not drop the rest of the frame
+        try:
+            widget._apply_value_changed()
+        except Exception:
+            carb.log_error(f"[play.with.font] {type(widget).__name__} value change failed:\n{traceback.format_exc()}")
+
+
+def enable_value_change_subscription():
+    """Allow value changes to be queued again, after an earlier release on
+    shutdown. Call on extension startup."""
+    global _released
+    _released = False
+
+
+def release_value_change_subscription():
+    """Drop the update subscription and any queued widgets, and stop queueing
+    new ones. Call on extension shutdown so a reload doesn't leave the old
+    module subscribed."""
+    global _update_sub, _released
+    _released = True
+    _update_sub = None
+    _pending.clear()
+
 
 class CustomComboboxWidget(CustomBaseWidget):
     """A customized combobox widget"""
 
+    __slots__ = ("__default_val", "__options", "__combobox_widget", "_model_ref", "_item_value_model")
+
     def __init__(self,
                  model: ui.AbstractItemModel = None,
                  options: List[str] = None,
                  default_value=0,
                  **kwargs):
         self.__default_val = default_value
-        self.__options = options or ["1", "2", "3"]
+        self.__options = tuple(options) if options else ("1", "2", "3")
         self.__combobox_widget = None
+        self._model_ref = None
+        self._item_value_model = None
 
         # Call at the end, rather than start, so build_fn runs after all the init stuff
         CustomBaseWidget.__init__(self, model=model, **kwargs)
 
     def destroy(self):
-        CustomBaseWidget.destroy()
+        CustomBaseWidget.destroy(self)
+        _pending.discard(self)
         self.__options = None
         self.__combobox_widget = None
+        self._model_ref = None
+        self._item_value_model = None
 
     @property
     def model(self) -> Optional[ui.AbstractItemModel]:
         """The widget's model"""
-        if self.__combobox_widget:
-            return self.__combobox_widget.model
+        return self._model_ref
 
     @model.setter
     def model(self, value: ui.AbstractItemModel):
         """The widget's model"""
         self.__combobox_widget.model = value
+        self._cache_model(value)
+
+    def _cache_model(self, model: ui.AbstractItemModel):
+        """Keep the model and its selected-item value model at hand, so
+        reads don't walk the combobox each time."""
+        self._model_ref = model
+        self._item_value_model = model.get_item_value_model()
 
     def _on_value_changed(self, *args):
+        _queue_value_changed(self)
+
+    def _apply_value_changed(self):
         """Set revert_img to correct state."""
-        model = self.__combobox_widget.model
-        index = model.get_item_value_model().get_value_as_int()
-        self.revert_img.enabled = self.__default_val != index
+        index = self._item_value_model.get_value_as_int()
+        self._set_revert_enabled(self.__default_val != index)
 
     def _restore_default(self):
         """Restore the default value."""
         if self.revert_img.enabled:
-            self.__combobox_widget.model.get_item_value_model().set_value(
-                self.__default_val)
+            self._item_value_model.set_value(self.__default_val)
             self.revert_img.enabled = False
 
     def _build_body(self):
@@ -65,14 +175,14 @@ class CustomComboboxWidget(CustomBaseWidget):
                 ui.Rectangle(name="combobox",
                              height=BLOCK_HEIGHT)
 
-                option_list = list(self.__options)
                 self.__combobox_widget = ui.ComboBox(
-                    0, *option_list,
+                    0, *self.__options,
                     name="dropdown_menu",
                     # Abnormal height because this "transparent" combobox
                     # has to fit inside the Rectangle behind it
                     height=10
                 )
+                self._cache_model(self.__combobox_widget.model)
 
                 # Swap for  different dropdown arrow image over current one
                 with ui.HStack():
@@ -84,14 +194,16 @@ class CustomComboboxWidget(CustomBaseWidget):
                             ui.Image(name="collapsable_closed", width=12, height=12)
                     ui.Spacer(width=2)  # Right margin
 
-            ui.Spacer(width=ui.Percent(30))
+            ui.Spacer(width=COMBOBOX_MARGIN_WIDTH)
 
-        self.__combobox_widget.model.add_item_changed_fn(self._on_value_changed)
+        self._model_ref.add_item_changed_fn(self._on_value_changed)
 
 
 class CustomBoolWidget(CustomBaseWidget):
     """A custom checkbox or switch widget"""
 
+    __slots__ = ("__default_val", "__bool_image", "on_checked_fn")
+
     def __init__(self,
                  model: ui.AbstractItemModel = None,
                  default_value: bool = True,
@@ -105,7 +217,7 @@ class CustomBoolWidget(CustomBaseWidget):
         CustomBaseWidget.__init__(self, model=model, **kwargs)
 
     def destroy(self):
-        CustomBaseWidget.destroy()
+        CustomBaseWidget.destroy(self)
         self.__bool_image = None
 
     def _restore_default(self):
@@ -120,14 +232,13 @@ class CustomBoolWidget(CustomBaseWidget):
 
     def _on_value_changed(self):
         """Swap checkbox images and set revert_img to correct state."""
-        self.__bool_image.checked = not self.__bool_image.checked
-        self.__bool_image.name = (
-            "checked" if self.__bool_image.checked else "unchecked"
-        )
-        self.revert_img.enabled = self.__default_val != self.__bool_image.checked
-        
+        checked = not self.__bool_image.checked
+        self.__bool_image.checked = checked
+        self.__bool_image.name = _BOOL_NAMES[checked]
+        self._set_revert_enabled(self.__default_val != checked)
+
         if self.on_checked_fn:
-            self.on_checked_fn(self.__bool_image.checked)
+            self.on_checked_fn(checked)
 
     def _build_body(self):
         """Main meat of the widget.  Draw the appropriate checkbox image, and
@@ -139,22 +250,17 @@ class CustomBoolWidget(CustomBaseWidget):
                 # all the other rows are.
                 ui.Spacer(height=2)
                 self.__bool_image = ui.Image(
-                    name="checked" if self.__default_val else "unchecked",
+                    name=_BOOL_NAMES[bool(self.__default_val)],
                     fill_policy=ui.FillPolicy.PRESERVE_ASPECT_FIT,
                     height=16, width=16, checked=self.__default_val
                 )
             # Let this spacer take up the rest of the Body space.
             ui.Spacer()
 
-        self.__bool_image.set_mouse_pressed_fn(
-            lambda x, y, b, m: self._on_value_changed())
-
+        self.__bool_image.set_mouse_pressed_fn(self._on_mouse_pressed)
 
-NUM_FIELD_WIDTH = 50
-SLIDER_WIDTH = ui.Percent(100)
-FIELD_HEIGHT = 22  # TODO: Once Field padding is fixed, this should be 18
-SPACING = 4
-TEXTURE_NAME = "slider_bg_texture"
+    def _on_mouse_pressed(self, x, y, b, m):
+        self._on_value_changed()
 
 
 class CustomSliderWidget(CustomBaseWidget):
@@ -162,6 +268,13 @@ class CustomSliderWidget(CustomBaseWidget):
     Slider and a Field with text input next to it.
     """
 
+    __slots__ = (
+        "__slider", "__numberfield", "__min", "__max", "__default_val",
+        "__num_type", "__display_range", "_show_zero", "_range_left_width",
+        "_range_right_width", "_model_ref", "_get_val", "on_slide_fn",
+        "_dispatch_interval", "_last_dispatch_t", "_last_dispatch_val",
+    )
+
     def __init__(self,
                  model: ui.AbstractItemModel = None,
                  num_type: str = "int",
@@ -178,15 +291,31 @@ class CustomSliderWidget(CustomBaseWidget):
         self.__default_val = default_val
         self.__num_type = num_type
         self.__display_range = display_range
+        # The range text never changes, so work out where the 0 label goes once
+        self._show_zero = min < 0 < max
+        if self._show_zero:
+            total_range = max - min
+            # subtract 25% to account for end number widths
+            self._range_left_width = ui.Percent(100 * abs(0 - min) / total_range - 25)
+            self._range_right_width = ui.Percent(100 * abs(max - 0) / total_range - 25)
+        self._model_ref = None
+        self._get_val = None
         self.on_slide_fn = on_slide_fn
+        # Drag ticks are coalesced so on_slide_fn runs at most this often
+        self._dispatch_interval = 1 / 30
+        self._last_dispatch_t = 0.0
+        self._last_dispatch_val = None
 
         # Call at the end, rather than start, so build_fn runs after all the init stuff
         CustomBaseWidget.__init__(self, model=model, **kwargs)
 
     def destroy(self):
-        CustomBaseWidget.destroy()
+        CustomBaseWidget.destroy(self)
+        _pending.discard(self)
         self.__slider = None
         self.__numberfield = None
+        self._model_ref = None
+        self._get_val = None
 
     @property
     def model(self) -> Optional[ui.AbstractItemModel]:
@@ -199,16 +328,45 @@ class CustomSliderWidget(CustomBaseWidget):
         """The widget's model"""
         self.__slider.model = value
         self.__numberfield.model = value
+        self._cache_model(value)
+
+    def _cache_model(self, model: ui.AbstractValueModel):
+        """Bind the model and its typed getter once, rather than resolving
+        them on every drag tick."""
+        self._model_ref = model
+        self._get_val = (
+            model.get_value_as_float if self.__num_type == "float"
+            else model.get_value_as_int
+        )
 
     def _on_value_changed(self, *args):
+        _queue_value_changed(self)
+
+    def _apply_value_changed(self):
         """Set revert_img to correct state."""
-        if self.__num_type == "float":
-            index = self.model.as_float
+        index = self._get_val()
+        self._set_revert_enabled(self.__default_val != index)
+
+        if not self.on_slide_fn:
+            return
+        now = time.monotonic()
+        if now - self._last_dispatch_t >= self._dispatch_interval:
+            self._last_dispatch_t = now
+            self._dispatch_slide(index)
         else:
-            index = self.model.as_int
-        self.revert_img.enabled = self.__default_val != index
+            # Throttled: retry on the next tick so the latest value still
+            # reaches on_slide_fn
+            _queue_value_changed(self)
 
+    def _on_slider_released(self, x, y, b, m):
+        """Always dispatch the value the drag ended on, even if the last
+        tick was throttled."""
         if self.on_slide_fn:
+            self._dispatch_slide(self._get_val())
+
+    def _dispatch_slide(self, index):
+        if index != self._last_dispatch_val:
+            self._last_dispatch_val = index
             self.on_slide_fn(index)
 
     def _restore_default(self):
@@ -221,16 +379,12 @@ class CustomSliderWidget(CustomBaseWidget):
         """Builds just the tiny text range under the slider."""
         with ui.HStack():
             ui.Label(str(self.__min), alignment=ui.Alignment.LEFT, name="range_text")
-            if self.__min < 0 and self.__max > 0:
+            if self._show_zero:
                 # Add middle value (always 0), but it may or may not be centered,
                 # depending on the min/max values.
-                total_range = self.__max - self.__min
-                # subtract 25% to account for end number widths
-                left = 100 * abs(0 - self.__min) / total_range - 25
-                right = 100 * abs(self.__max - 0) / total_range - 25
-                ui.Spacer(width=ui.Percent(left))
+                ui.Spacer(width=self._range_left_width)
                 ui.Label("0", alignment=ui.Alignment.CENTER, name="range_text")
-                ui.Spacer(width=ui.Percent(right))
+                ui.Spacer(width=self._range_right_width)
             else:
                 ui.Spacer()
             ui.Label(str(self.__max), alignment=ui.Alignment.RIGHT, name="range_text")
@@ -242,19 +396,16 @@ class CustomSliderWidget(CustomBaseWidget):
         """
         with ui.HStack(spacing=0):
             # the user provided a list of default values
-            with ui.VStack(spacing=3, width=ui.Fraction(3)):
+            with ui.VStack(spacing=3, width=SLIDER_COLUMN_WIDTH):
                 with ui.ZStack():
                     # Put texture image here, with rounded corners, then make slider
                     # bg be fully transparent, and fg be gray and partially transparent
-                    with ui.Frame(width=SLIDER_WIDTH, height=FIELD_HEIGHT,
-                                  horizontal_clipping=True):
-                        # Spacing is negative because "tileable" texture wasn't
-                        # perfectly tileable, so that adds some overlap to line up better.
-                        with ui.HStack(spacing=-12):
-                            for i in range(50):  # tiling the texture
-                                ui.Image(name=TEXTURE_NAME,
-                                         fill_policy=ui.FillPolicy.PRESERVE_ASPECT_CROP,
-                                         width=50,)
+                    # The texture is pre-tiled in the image file, so one image
+                    # cropped from the left keeps the stripes at their tile scale.
+                    ui.Image(name=TEXTURE_NAME,
+                             fill_policy=ui.FillPolicy.PRESERVE_ASPECT_CROP,
+                             alignment=ui.Alignment.LEFT,
+                             width=SLIDER_WIDTH, height=FIELD_HEIGHT)
 
                     slider_cls = (
                         ui.FloatSlider if self.__num_type == "float" else ui.IntSlider
@@ -263,13 +414,15 @@ class CustomSliderWidget(CustomBaseWidget):
                         height=FIELD_HEIGHT,
                         min=self.__min, max=self.__max, name="attr_slider"
                     )
+                    self.__slider.set_mouse_released_fn(self._on_slider_released)
 
                 if self.__display_range:
                     self._build_display_range()
 
-            with ui.VStack(width=ui.Fraction(1)):
+            with ui.VStack(width=FIELD_COLUMN_WIDTH):
                 model = self.__slider.model
                 model.set_value(self.__default_val)
+                self._cache_model(model)
                 field_cls = (
                     ui.FloatField if self.__num_type == "float" else ui.IntField
                 )
@@ -289,12 +442,7 @@ class CustomSliderWidget(CustomBaseWidget):
                         self.__numberfield = field_cls(
                             model,
                             height=0,
-                            style={
-                                "background_color": cl.transparent,
-                                "border_color": cl.transparent,
-                                "padding": 4,
-                                "font_size": fl.field_text_font_size,
-                            },
+                            style=_FIELD_STYLE,
                         )
                 if self.__display_range:
                     ui.Spacer()
@@ -302,39 +450,47 @@ class CustomSliderWidget(CustomBaseWidget):
         model.add_value_changed_fn(self._on_value_changed)
 
 
-class CustomSkySelectionGroup(CustomBaseWidget):
+class CustomButtonSelectionGroup(CustomBaseWidget):
+    """A row of buttons where exactly one can be pressed at a time.
+    options is a tuple of (key, label) pairs; the capitalized key of the
+    pressed button is passed to on_select_fn.
+    """
+
+    __slots__ = ("on_select_fn", "__options", "_button_map")
+
     def __init__(self,
-        on_select_fn: callable = None 
+        label: str,
+        options: tuple,
+        on_select_fn: callable = None,
+        default_option: str = None
     ) -> None:
         self.on_select_fn = on_select_fn
-        self.sky_type = ""
-        CustomBaseWidget.__init__(self, label = "Sky type:")
+        self.__options = options
+        CustomBaseWidget.__init__(self, label = label)
+
+        if default_option:
+            self._on_button(default_option)
 
     def _build_body(self):
         with ui.HStack():
-            self.button_clear = ui.Button("Sunny", name = "control_button")
-            self.button_cloudy = ui.Button("Cloudy", name = "control_button")
-            self.button_overcast = ui.Button("Overcast", name = "control_button")
-            self.button_night = ui.Button("Night", name = "control_button")
-
-        self.button_clear.set_clicked_fn(lambda : self._on_button("clear"))
-        self.button_cloudy.set_clicked_fn(lambda : self._on_button("cloudy"))
-        self.button_overcast.set_clicked_fn(lambda : self._on_button("overcast"))
-        self.button_night.set_clicked_fn(lambda : self._on_button("night"))
+            self._button_map = {
+                key: ui.Button(label, name = "control_button") for key, label in self.__options
+            }
 
-        self.button_list = [self.button_clear, self.button_cloudy, self.button_overcast,  self.button_night]
+        for key, button in self._button_map.items():
+            button.set_clicked_fn(partial(self._on_button, key))
 
     def enable_buttons(self):
-        for button in self.button_list:
+        for button in self._button_map.values():
             button.enabled = True
             button.name = "control_button"
 
-    def _on_button(self, sky_type:str):
+    def _on_button(self, option:str):
         if self.on_select_fn:
-            self.on_select_fn(sky_type.capitalize())
+            self.on_select_fn(option.capitalize())
         self.enable_buttons()
-        button = getattr(self, f"button_{sky_type}")
-        button.name = f"control_button_pressed{2}"
+        button = self._button_map[option]
+        button.name = PRESSED_BUTTON_NAME
         self.revert_img.enabled = True
 
     def _restore_default(self):
@@ -344,61 +500,31 @@ class CustomSkySelectionGroup(CustomBaseWidget):
             self.enable_buttons()
             self.on_select_fn("")
 
-class CustomFlowSelectionGroup(CustomBaseWidget):
-    def __init__(self,
-        on_select_fn: callable = None 
-    ) -> None:
-        self.on_select_fn = on_select_fn
-        self.sky_type = ""
-        CustomBaseWidget.__init__(self, label = "Flow type:")
-
-        # default type
-        self._on_button("fire")
-
-    def _build_body(self):
-        with ui.HStack():
-            self.button_fire = ui.Button("Fire", name = "control_button")
-            self.button_smoke = ui.Button("Smoke", name = "control_button")
-            self.button_dust = ui.Button("Dust", name = "control_button")
-
-        self.button_fire.set_clicked_fn(lambda : self._on_button("fire"))
-        self.button_smoke.set_clicked_fn(lambda : self._on_button("smoke"))
-        self.button_dust.set_clicked_fn(lambda : self._on_button("dust"))
 
-        self.button_list = [self.button_fire, self.button_smoke, self.button_dust]
+def CustomSkySelectionGroup(on_select_fn: callable = None) -> CustomButtonSelectionGroup:
+    return CustomButtonSelectionGroup("Sky type:", _SKY_BUTTONS, on_select_fn)
 
-        # default
-        # self._on_button("fire")
 
-    def enable_buttons(self):
-        for button in self.button_list:
-            button.enabled = True
-            button.name = "control_button"
+def CustomFlowSelectionGroup(on_select_fn: callable = None) -> CustomButtonSelectionGroup:
+    return CustomButtonSelectionGroup("Flow type:", _FLOW_BUTTONS, on_select_fn,
+                                      default_option="fire")
 
-    def _on_button(self, flow_type:str):
-        if self.on_select_fn:
-            self.on_select_fn(flow_type.capitalize())
-
-        self.enable_buttons()
-        button = getattr(self, f"button_{flow_type}")
-        button.name = f"control_button_pressed{2}"
-        self.revert_img.enabled = True
 
-    def _restore_default(self):
-        """Restore the default value."""
-        if self.revert_img.enabled:
-            self.revert_img.enabled = False
-            self.enable_buttons()
-            self.on_select_fn("")
+class CustomStringField(CustomBaseWidget):
+    __slots__ = ("label", "string_ui_name", "default_value", "model")
 
+    DEFAULT_VALUE = "A"
+    # No revert arrow for the text field
+    HAS_TAIL = False
 
-class CustomStringField(CustomBaseWidget):
     def __init__(self,
         label:str,
-        string_ui_name = "input_text"
+        string_ui_name = "input_text",
+        default_value: str = DEFAULT_VALUE
     ) -> None:
         self.label = label
         self.string_ui_name = string_ui_name
+        self.default_value = default_value
         CustomBaseWidget.__init__(self, label = label)
 
     def _build_body(self):
@@ -406,18 +532,35 @@ class CustomStringField(CustomBaseWidget):
             string_ui = ui.StringField(height = 20, width = 50)
 
         self.model = string_ui.model
-        self.model.set_value("A")
+        self.model.set_value(self.default_value)
+
+_OPENER = None
 
-    def _build_tail(self):
-        return 
 
-import subprocess, os, platform
+def _get_opener():
+    """Resolve the folder opener for this platform on first use. The
+    imports live here so loading the UI module doesn't pay for them."""
+    global _OPENER
+    if _OPENER is None:
+        import subprocess, os, platform
+        _OPENER = {
+            "Darwin": lambda p: subprocess.call(("open", p)),  # macOS
+            "Windows": lambda p: os.startfile(p),  # Windows
+        }.get(platform.system(), lambda p: subprocess.call(("xdg-open", p)))  # linux variants
+    return _OPENER
+
 
 class CustomPathButtonWidget:
     """A compound widget for holding a path in a StringField, and a button
     that can perform an action.
     TODO: Get text ellision working in the path field, to start with "..."
     """
+
+    __slots__ = (
+        "__attr_label", "__pathfield", "__path", "__btn", "__callback",
+        "__frame", "folder_img",
+    )
+
     def __init__(self,
                  label: str,
                  path: str,
@@ -477,12 +620,11 @@ class CustomPathButtonWidget:
                 height=18,
             )
 
-            self.folder_img.set_mouse_pressed_fn(lambda x, y, b, m: self.open_path(self.__path))
+            self.folder_img.set_mouse_pressed_fn(self._on_folder_clicked)
+
+    def _on_folder_clicked(self, x, y, b, m):
+        self.open_path(self.__path)
 
     def open_path(self, path):
-        if platform.system() == "Darwin":  # macOS
-            subprocess.call(("open", path))
-        elif platform.system() == "Windows":  # Windows
-            os.startfile(path)
-        else:  # linux variants
-            subprocess.call(("xdg-open", path))
+        _get_opener()(path)
+
@@ -65,6 +65,8 @@ url.checkbox_off_icon = f"{EXTENSION_FOLDER_PATH}/icons/checkbox_off.svg"
 url.radio_btn_on_icon = f"{EXTENSION_FOLDER_PATH}/icons/radio_btn_on.svg"
 url.radio_btn_off_icon = f"{EXTENSION_FOLDER_PATH}/icons/radio_btn_off.svg"
 url.diag_bg_lines_texture = f"{EXTENSION_FOLDER_PATH}/icons/diagonal_texture_screenshot.png"
+# diagonal_texture_screenshot.png laid out as 50 overlapping slider-height tiles
+url.diag_bg_tiled_texture = f"{EXTENSION_FOLDER_PATH}/icons/diagonal_texture_tiled.png"
 
 ####################### Indoor Kit ###########################################
 # url.start_btn_on_icon = f"{EXTENSION_FOLDER_PATH}/icons/random.svg"       
@@ -158,7 +160,7 @@ julia_modeler_style = {
     "Image::checked": {"image_url": url.checkbox_on_icon},
     "Image::unchecked": {"image_url": url.checkbox_off_icon},
     "Image::slider_bg_texture": {
-        "image_url": url.diag_bg_lines_texture,
+        "image_url": url.diag_bg_tiled_texture,
         "border_radius": fl.border_radius,
         "corner_flag": ui.CornerFlag.LEFT,
     },